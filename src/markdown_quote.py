@@ -14,18 +14,46 @@ And replaces them with the actual content from the referenced files.
 
 import os
 import re
-import glob
 import argparse
-from collections import deque, defaultdict
+import functools
+import tempfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+
+# Regular expression patterns for parsing quote blocks, compiled once at
+# module load.
+#
+# The begin comment is matched with a deliberately simple structure: the
+# attribute section is a flat repetition of key="value" pairs with no
+# alternation or nested lazy quantifiers, so matching is linear in the
+# input.  The attribute section is split into a dict by a hand-written
+# scanner, and the content attribute's markdown link is unpacked with a
+# second pattern.
+_BEGIN_RE = re.compile(r'<!--\s*quote_begin((?:\s+\w+="[^"]*")*)\s*-->')
+_LINK_RE = re.compile(r'\[([\s\S]*?)\]\(([\s\S]*?)\)')
+# Canonical end comment, located with a plain substring search rather than
+# a second regex pass
+_END_LITERAL = '<!-- quote_end -->'
+_END_LITERAL_LEN = len(_END_LITERAL)
+
+
+def report(messages, text):
+    """
+    Record a diagnostic message, or print it when no collector is given.
 
+    Worker processes collect their messages and return them to the driver,
+    which prints them in one place; printing directly from workers would
+    serialize them on the stdout lock.
 
-# Regular expression patterns for parsing quote blocks
-CONTENT_PATTERN = r'\s+content="\[([\s\S]*?)\]\((?P<content>[\s\S]*?)\)"'
-LANG_PATTERN = r'\s+lang="(?P<lang>.*?)"'
-VALUES_PATTERN = rf'(({CONTENT_PATTERN})|({LANG_PATTERN}))*'
-BEGIN_PATTERN = rf'<!--\s*quote_begin({VALUES_PATTERN})\s*-->'
-END_PATTERN = r'<!--\s*quote_end\s*-->'
-QUOTE_PATTERN = rf'(?P<begin_block>{BEGIN_PATTERN})([.\s\S]*)(?P<end_block>{END_PATTERN})'
+    Args:
+        messages: List collecting messages, or None to print immediately
+        text: Message text
+    """
+    if messages is None:
+        print(text)
+    else:
+        messages.append(text)
 
 
 def topological_sort(dependencies):
@@ -41,54 +69,150 @@ def topological_sort(dependencies):
                     This means the key file must be processed before all files in the value set
 
     Returns:
-        list: Files in topological order (files with no dependencies first),
-              or empty list if a cycle is detected
+        list: Layers of files in topological order.  Each layer is a list of
+              files whose dependencies are all in earlier layers, so files
+              within a layer can be processed independently of each other.
+              Returns an empty list if a cycle is detected.
     """
-    # Build in-degree count and adjacency list
-    in_degree = defaultdict(int)  # Tracks how many dependencies each file has
-    graph = defaultdict(list)     # Maps files to their dependents
-
     # Collect all nodes from the dependency graph
-    all_nodes = set()
-    for key, dependents in dependencies.items():
-        all_nodes.add(key)
+    all_nodes = set(dependencies)
+    for dependents in dependencies.values():
         all_nodes.update(dependents)
 
-    # Build the graph structure
-    # If file A depends on file B, we have: B -> A (B must be processed before A)
-    for key, dependents in dependencies.items():
+    # Count how many dependencies each file has.  The input mapping already
+    # is the adjacency (key -> its dependents), so no separate graph copy
+    # is needed
+    in_degree = dict.fromkeys(all_nodes, 0)
+    for dependents in dependencies.values():
         for dependent in dependents:
-            graph[key].append(dependent)
             in_degree[dependent] += 1
 
     # Initialize queue with nodes having zero in-degree (no dependencies)
-    queue = deque()
-    for node in all_nodes:
-        if in_degree[node] == 0:
-            queue.append(node)
+    queue = deque(node for node in all_nodes if in_degree[node] == 0)
 
-    # Perform topological sort using Kahn's algorithm
-    result = []
+    # Perform topological sort using Kahn's algorithm, one BFS round per
+    # layer: nodes whose in-degree hits zero in the same round only depend
+    # on earlier layers
+    layers = []
+    node_count = 0
     while queue:
-        current_node = queue.popleft()
-        result.append(current_node)
-
-        # Process all nodes that depend on the current node
-        for neighbor in graph.get(current_node, []):
-            in_degree[neighbor] -= 1
-            # If neighbor has no more dependencies, add to queue
-            if in_degree[neighbor] == 0:
-                queue.append(neighbor)
+        next_queue = deque()
+        layer = []
+        while queue:
+            current_node = queue.popleft()
+            layer.append(current_node)
+            node_count += 1
+
+            # Process all nodes that depend on the current node
+            for neighbor in dependencies.get(current_node, ()):
+                in_degree[neighbor] -= 1
+                # If neighbor has no more dependencies, add to next layer
+                if in_degree[neighbor] == 0:
+                    next_queue.append(neighbor)
+        layers.append(layer)
+        queue = next_queue
 
     # Check for cycles - if result doesn't include all nodes, a cycle exists
-    if len(result) != len(all_nodes):
+    if node_count != len(all_nodes):
         print("Cycle detected in dependency graph")
         return []
 
+    return layers
+
+
+def topological_sort_dfs(dependencies):
+    """
+    Perform topological sorting using depth-first search.
+
+    Alternative to topological_sort for callers that only need a flat
+    processing order: DFS needs no in-degree table, no node queue and no
+    layer lists, just a color map and one stack, and detects cycles in the
+    same pass.  main keeps using the layered Kahn variant because the
+    layers are what allow parallel processing.
+
+    Args:
+        dependencies: Dictionary where key is a file path, value is a set of
+                    files that depend on the key (same format as
+                    topological_sort)
+
+    Returns:
+        list: Files in topological order (files with no dependencies first),
+              or empty list if a cycle is detected
+    """
+    all_nodes = set(dependencies)
+    for dependents in dependencies.values():
+        all_nodes.update(dependents)
+
+    # 0 = unvisited, 1 = on the current DFS path, 2 = finished
+    color = dict.fromkeys(all_nodes, 0)
+    result = []
+
+    for root in all_nodes:
+        if color[root] != 0:
+            continue
+
+        # Explicit stack of (node, child iterator) frames instead of
+        # recursion, so deep graphs cannot hit the recursion limit
+        color[root] = 1
+        stack = [(root, iter(dependencies.get(root, ())))]
+        while stack:
+            node, children = stack[-1]
+            for child in children:
+                # A child on the current DFS path means a cycle
+                if color[child] == 1:
+                    print("Cycle detected in dependency graph")
+                    return []
+                if color[child] == 0:
+                    color[child] = 1
+                    stack.append((child, iter(dependencies.get(child, ()))))
+                    break
+            else:
+                # All children done: record node in post-order
+                color[node] = 2
+                result.append(node)
+                stack.pop()
+
+    # Post-order lists dependents before the files they depend on; reverse
+    # to put dependencies first
+    result.reverse()
     return result
 
 
-def extract_line_range(file_path, start_line, end_line):
+@functools.lru_cache(maxsize=256)
+def _read_line_range(file_path, start_line, end_line):
+    """
+    Read the specified line range from a file, caching the result.
+
+    Quote blocks across a corpus frequently reference the same source
+    ranges, so results are memoized by (path, start, end) to avoid
+    re-reading the file for every block.
+
+    Args:
+        file_path: Normalized path to the file to read
+        start_line: Starting line number (1-based)
+        end_line: Ending line number (1-based)
+
+    Returns:
+        str: Content from the specified line range
+    """
+    start_line = max(1, start_line)
+    end_line = max(start_line, end_line)
+
+    # Stream the file, keeping only the requested lines and stopping as
+    # soon as end_line is reached; EOF clamps the range implicitly, so no
+    # line count of the whole file is ever needed
+    content_lines = []
+    with open(file_path, 'r', encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            if line_number >= start_line:
+                content_lines.append(line)
+            if line_number >= end_line:
+                break
+
+    return ''.join(content_lines)
+
+
+def extract_line_range(file_path, start_line, end_line, messages=None):
     """
     Extract content from specified line range in a file.
 
@@ -96,23 +220,17 @@ def extract_line_range(file_path, start_line, end_line):
         file_path: Path to the file to read
         start_line: Starting line number (1-based)
         end_line: Ending line number (1-based)
+        messages: Optional list collecting diagnostics instead of printing
 
     Returns:
         str: Content from the specified line range, or None if error occurs
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-
-        # Ensure line numbers are within valid range
-        start_line = max(1, min(start_line, len(lines)))
-        end_line = max(start_line, min(end_line, len(lines)))
-
-        # Extract specified line range (convert to 0-based indexing)
-        content_lines = lines[start_line - 1:end_line]
-        return ''.join(content_lines)
+        # Normalize so different relative spellings of the same file share
+        # one cache entry
+        return _read_line_range(normalized_path(file_path), start_line, end_line)
     except Exception as e:
-        print(f"Error reading file {file_path}: {e}")
+        report(messages, f"Error reading file {file_path}: {e}")
         return None
 
 
@@ -128,35 +246,85 @@ def parse_path_spec(path_spec):
     Returns:
         tuple: (file_path, start_line, end_line) or (None, None, None) if parsing fails
     """
-    # Use regex to match path and line numbers
-    match = re.match(r'(.+)#L(\d+)-L(\d+)', path_spec)
-    if not match:
+    # The grammar is just path + "#L" + int + "-L" + int, so two substring
+    # searches beat spinning up the regex engine for every quote block
+    hash_idx = path_spec.rfind('#L')
+    if hash_idx <= 0:
         return None, None, None
 
-    file_path = match.group(1)
-    start_line = int(match.group(2))
-    end_line = int(match.group(3))
+    file_path = path_spec[:hash_idx]
+    line_range = path_spec[hash_idx + 2:]
+
+    dash_idx = line_range.find('-L')
+    if dash_idx < 0:
+        return None, None, None
+
+    try:
+        start_line = int(line_range[:dash_idx])
+        end_line = int(line_range[dash_idx + 2:])
+    except ValueError:
+        return None, None, None
 
     return file_path, start_line, end_line
 
 
-def process_parameters(match):
+def parse_attributes(attr_text):
+    """
+    Parse the attribute section of a quote_begin comment into a dictionary.
+
+    Format example: ' content="[desc](path#L1-L2)" lang="rust"'
+
+    Args:
+        attr_text: Attribute section captured from the begin comment
+
+    Returns:
+        dict: Mapping of attribute names to their values
+    """
+    # The attribute section is at most a couple hundred bytes, where a
+    # hand-written scan beats entering the regex engine per quote block
+    attrs = {}
+    i = 0
+    n = len(attr_text)
+    while i < n:
+        # Skip whitespace between attributes
+        while i < n and attr_text[i].isspace():
+            i += 1
+        if i >= n:
+            break
+
+        # Key runs up to '=', value sits between the following quotes
+        eq = attr_text.find('=', i)
+        if eq < 0 or eq + 1 >= n or attr_text[eq + 1] != '"':
+            break
+        close = attr_text.find('"', eq + 2)
+        if close < 0:
+            break
+
+        attrs[attr_text[i:eq]] = attr_text[eq + 2:close]
+        i = close + 1
+
+    return attrs
+
+
+def process_parameters(attrs):
     """
-    Extract parameter information from regex match.
+    Extract parameter information from a quote block's attributes.
 
     Args:
-        match: Regex match object from quote pattern
+        attrs: Dictionary of attributes from the quote_begin comment
 
     Returns:
         tuple: (file_path, start_line, end_line, language)
     """
-    # Extract path information from content group
-    content_block = match.group("content")
-    file_path, start_line, end_line = parse_path_spec(content_block)
+    # Extract path information from the content attribute's markdown link
+    link_match = _LINK_RE.match(attrs.get("content", ""))
+    if link_match:
+        file_path, start_line, end_line = parse_path_spec(link_match.group(2))
+    else:
+        file_path, start_line, end_line = None, None, None
 
     # Extract language or default to "text"
-    lang = match.group("lang")
-    lang = lang if lang else "text"
+    lang = attrs.get("lang") or "text"
 
     return file_path, start_line, end_line, lang
 
@@ -178,22 +346,25 @@ def to_full_path(file_path, md_file_dir):
         return os.path.join(md_file_dir, file_path)
 
 
-def process_quote_block(match, md_file_dir):
+def process_quote_block(begin_match, md_file_dir, quote_cache, messages=None):
     """
     Process a single quote block and replace its content with referenced file content.
 
     Args:
-        match: Regex match object for the quote block
+        begin_match: Regex match object for the quote_begin comment
         md_file_dir: Directory of the markdown file being processed
+        quote_cache: Dictionary memoizing rendered content per reference,
+                    shared across the blocks of one document
+        messages: Optional list collecting diagnostics instead of printing
 
     Returns:
         str: New block content with referenced file content, or None if processing fails
     """
-    quote_begin_block = match.group("begin_block")
-    quote_end_block = match.group("end_block")
+    quote_begin_block = begin_match.group(0)
 
     # Extract path information from the match
-    file_path, start_line, end_line, lang = process_parameters(match)
+    attrs = parse_attributes(begin_match.group(1))
+    file_path, start_line, end_line, lang = process_parameters(attrs)
 
     if not file_path:
         return None
@@ -201,29 +372,40 @@ def process_quote_block(match, md_file_dir):
     # Convert to absolute path
     full_file_path = to_full_path(file_path, md_file_dir)
 
-    # Read content from specified file and line range
-    text_content = extract_line_range(full_file_path, start_line, end_line)
-    if text_content is None:
-        return None
-
-    # Format the content based on language
-    if lang != "text":
-        # For source code, create a code block with language specification
-        new_code_block = f"```{lang}\n{text_content}```"
-    else:
-        # For non-code content, output directly
-        new_code_block = f"\n{text_content}"
+    # Documents often quote the same reference more than once; render its
+    # content once and reuse it for the duplicates
+    cache_key = (full_file_path, start_line, end_line, lang)
+    new_code_block = quote_cache.get(cache_key)
+    if new_code_block is None:
+        # Read content from specified file and line range
+        text_content = extract_line_range(full_file_path, start_line, end_line, messages)
+        if text_content is None:
+            return None
+
+        # Format the content based on language
+        if lang != "text":
+            # For source code, create a code block with language specification
+            new_code_block = f"```{lang}\n{text_content}```"
+        else:
+            # For non-code content, output directly
+            new_code_block = f"\n{text_content}"
+
+        quote_cache[cache_key] = new_code_block
 
     # Rebuild the block with new content
-    new_block = f'{quote_begin_block}\n{new_code_block}\n{quote_end_block}'
+    new_block = f'{quote_begin_block}\n{new_code_block}\n{_END_LITERAL}'
 
     return new_block
 
 
+@functools.lru_cache(maxsize=4096)
 def normalized_path(file_path):
     """
     Normalize file path to absolute and standardized format.
 
+    Normalization (getcwd plus several string passes) runs once per file
+    and per quote block, so results are memoized.
+
     Args:
         file_path: Input file path
 
@@ -234,88 +416,207 @@ def normalized_path(file_path):
     return os.path.normpath(abs_path)
 
 
-def pre_process_md_file(md_file_path, dependency_map):
+def rewrite_quote_blocks(content, md_file_dir, messages=None):
+    """
+    Replace every quote block in a document with referenced file content.
+
+    Scans the document once from left to right, emitting untouched slices
+    and rebuilt blocks into a list joined at the end, instead of re-running
+    the quote pattern over the whole document via re.sub.
+
+    Args:
+        content: Full text of the markdown file
+        md_file_dir: Directory of the markdown file being processed
+        messages: Optional list collecting diagnostics instead of printing
+
+    Returns:
+        str: Document text with quote blocks replaced
+    """
+    out = []
+    pos = 0
+
+    # Rendered content shared between duplicate references in this document
+    quote_cache = {}
+
+    # Hoist the attribute lookups out of the loop; emit, find and search
+    # run once or twice per quote block
+    emit = out.append
+    find = content.find
+    search = _BEGIN_RE.search
+
+    # Drive the scan with Pattern.search from an explicit position instead
+    # of a finditer generator: advancing past each consumed block makes
+    # begin comments inside a block's body impossible to match, with no
+    # iterator protocol overhead per block
+    while True:
+        begin_match = search(content, pos)
+        if begin_match is None:
+            break
+
+        # Locate the matching end comment with a plain substring search
+        end = find(_END_LITERAL, begin_match.end())
+        if end < 0:
+            break
+        block_end = end + _END_LITERAL_LEN
+
+        emit(content[pos:begin_match.start()])
+
+        new_block = process_quote_block(begin_match, md_file_dir, quote_cache, messages)
+        if new_block is None:
+            # Leave unparseable blocks untouched
+            emit(content[begin_match.start():block_end])
+        else:
+            emit(new_block)
+
+        pos = block_end
+
+    emit(content[pos:])
+    return ''.join(out)
+
+
+def pre_process_md_file(md_file_path, dependency_map, content_cache, messages=None):
     """
     Pre-process a markdown file to build dependency relationships.
 
     This function scans for quote blocks and records which files depend on which other files.
+    The file content is cached so the second pass does not read it again.
 
     Args:
         md_file_path: Path to the markdown file to pre-process
         dependency_map: Dictionary to update with dependency information
+        content_cache: Dictionary mapping normalized file path to content,
+                    updated with this file's content
+        messages: Optional list collecting diagnostics instead of printing
     """
     try:
-        with open(md_file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        md_file_dir = os.path.dirname(md_file_path)
-
-        # Find all quote blocks in the file
-        match_list = re.finditer(QUOTE_PATTERN, content, flags=re.DOTALL)
+        # Read as bytes and decode once, so cached content round-trips
+        # byte-for-byte without newline translation
+        with open(md_file_path, 'rb') as f:
+            content = f.read().decode('utf-8')
 
         # Get normalized path of current file
         this_file_normalized = normalized_path(md_file_path)
+        content_cache[this_file_normalized] = content
+
+        # Fast literal prefilter: most files contain no quote blocks at
+        # all, and a substring check is far cheaper than the regex scan
+        if 'quote_begin' not in content:
+            return
+
+        md_file_dir = os.path.dirname(md_file_path)
 
-        # Process each quote block to extract dependencies
-        for match in match_list:
-            file_path, _start_line, _end_line, _ = process_parameters(match)
+        # Walk the top-level quote blocks with the same scan as
+        # rewrite_quote_blocks: advance past each block's end comment, so
+        # begin comments nested inside a block's body (stale output of a
+        # prior run) register no dependency.  The two passes must agree on
+        # what counts as a block, or nested comments create spurious
+        # edges — including self-loops that abort the sort as cycles
+        search = _BEGIN_RE.search
+        find = content.find
+        pos = 0
+        while True:
+            match = search(content, pos)
+            if match is None:
+                break
+            end = find(_END_LITERAL, match.end())
+            if end < 0:
+                break
+            pos = end + _END_LITERAL_LEN
+
+            attrs = parse_attributes(match.group(1))
+            file_path, _start_line, _end_line, _ = process_parameters(attrs)
+            if not file_path:
+                continue
             full_file_path = to_full_path(file_path, md_file_dir)
             depend_file_normalized = normalized_path(full_file_path)
 
             # Add dependency relationship: depend_file -> this_file
             # Meaning: depend_file must be processed before this_file
-            if depend_file_normalized not in dependency_map:
-                dependency_map[depend_file_normalized] = {this_file_normalized}
-            else:
-                dependency_map[depend_file_normalized].add(this_file_normalized)
+            dependency_map.setdefault(depend_file_normalized, set()).add(this_file_normalized)
 
     except Exception as e:
-        print(f"Error pre-processing file {md_file_path}: {e}")
+        report(messages, f"Error pre-processing file {md_file_path}: {e}")
 
 
-def process_md_file(md_file_path):
+def process_md_file(md_file_path, content=None):
     """
     Process a single markdown file, replacing quote blocks with actual content.
 
+    Runs in a worker process; diagnostics are collected and returned
+    rather than printed, so workers never contend on the stdout lock.
+
     Args:
         md_file_path: Path to the markdown file to process
+        content: File content cached by the pre-processing pass, or None to
+                read it from disk
+
+    Returns:
+        list: Messages for the driver to print
     """
+    messages = []
     try:
-        with open(md_file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        if content is None:
+            with open(md_file_path, 'rb') as f:
+                content = f.read().decode('utf-8')
+
+        # Fast literal prefilter: skip the scan and write-back entirely
+        # for files without quote blocks
+        if 'quote_begin' not in content:
+            return messages
 
         md_file_dir = os.path.dirname(md_file_path)
 
         # Replace all quote blocks with actual content
-        new_content = re.sub(
-            QUOTE_PATTERN,
-            lambda match: process_quote_block(match, md_file_dir),
-            content,
-            flags=re.DOTALL
-        )
-
-        # Write back to file only if content changed
+        new_content = rewrite_quote_blocks(content, md_file_dir, messages)
+
+        # Write back only if content changed: encode once, write to a
+        # temporary file in the same directory, then rename over the
+        # original so a crash mid-write cannot leave a truncated file
         if new_content != content:
-            with open(md_file_path, 'w', encoding='utf-8') as f:
-                f.write(new_content)
-            print(f"Updated quotes in: {md_file_path}")
+            fd, tmp_path = tempfile.mkstemp(dir=md_file_dir)
+            try:
+                os.write(fd, new_content.encode('utf-8'))
+            finally:
+                os.close(fd)
+            # mkstemp creates the file with mode 0600; carry the
+            # original's mode over so the rename does not change it
+            os.chmod(tmp_path, os.stat(md_file_path).st_mode)
+            os.replace(tmp_path, md_file_path)
+            messages.append(f"Updated quotes in: {md_file_path}")
 
     except Exception as e:
-        print(f"Error processing file {md_file_path}: {e}")
+        messages.append(f"Error processing file {md_file_path}: {e}")
+
+    return messages
 
 
-def is_md_file(filename):
+def walk_md_files(root):
     """
-    Check if a file is a markdown file based on extension.
+    Recursively yield paths of all markdown files under a directory.
+
+    Walks with os.scandir and a plain extension check, which avoids the
+    fnmatch overhead and intermediate list of glob.glob("**/*.md").
+    Matching glob's traversal, dot-prefixed entries (.git, .venv, ...) are
+    skipped, unreadable directories are ignored, and symlinked directories
+    are not followed.
 
     Args:
-        filename: File name or path to check
+        root: Directory to walk
 
-    Returns:
-        bool: True if file has .md extension (case-insensitive)
+    Yields:
+        str: Path of each .md file found
     """
-    _, ext = os.path.splitext(filename)
-    return ext.lower() == '.md'
+    try:
+        entries = os.scandir(root)
+    except OSError:
+        return
+    for entry in entries:
+        if entry.name.startswith('.'):
+            continue
+        if entry.is_dir(follow_symlinks=False):
+            yield from walk_md_files(entry.path)
+        elif entry.name.lower().endswith('.md'):
+            yield entry.path
 
 
 def main():
@@ -342,7 +643,7 @@ def main():
         return
 
     # Find all .md files recursively
-    md_files = glob.glob(os.path.join(folder_path, "**/*.md"), recursive=True)
+    md_files = list(walk_md_files(folder_path))
 
     if not md_files:
         print("No markdown files found")
@@ -351,18 +652,33 @@ def main():
     n = len(md_files)
     print(f"Found {n} markdown files")
 
-    # First pass: Build dependency map
+    # First pass: Build dependency map and cache file contents for the
+    # second pass
     dep_map = {}
+    content_cache = {}
     for md_file in md_files:
-        pre_process_md_file(md_file, dep_map)
-
-    # Sort files based on dependencies (files with no dependencies first)
-    sorted_files = topological_sort(dep_map)
-
-    # Second pass: Process files in dependency order
-    for file_path in sorted_files:
-        if is_md_file(file_path):
-            process_md_file(file_path)
+        pre_process_md_file(md_file, dep_map, content_cache)
+
+    # Sort files into dependency layers (files with no dependencies first)
+    layers = topological_sort(dep_map)
+
+    # The dependency graph also contains referenced source files; only the
+    # markdown files found by the walk need processing
+    md_set = set(content_cache)
+
+    # Second pass: Process layers in dependency order.  Files within a
+    # layer are independent of each other, so each layer is processed in
+    # parallel
+    with ProcessPoolExecutor() as executor:
+        for layer in layers:
+            layer_md_files = [f for f in layer if f in md_set]
+            if layer_md_files:
+                contents = [content_cache.get(f) for f in layer_md_files]
+                # Workers return their messages; print them here in one
+                # place instead of contending on stdout across processes
+                for messages in executor.map(process_md_file, layer_md_files, contents):
+                    for message in messages:
+                        print(message)
 
     print("Quote processing completed")
 